@@ -1,84 +1,157 @@
 import os
-import ccxt
-import pandas as pd
+import asyncio
+import bisect
+import ccxt.async_support as ccxt_async
+import numpy as np
 from datetime import datetime
-import requests
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
-import json
 import time
+import pickle
 from sentiment_analyzer import SentimentAnalyzer
 from technical_analyzer import TechnicalAnalyzer
+from ohlcv_cache import OHLCVCache
+
+DAY_MS = 24 * 60 * 60 * 1000
 
 class CryptoAnalyzer:
     def __init__(self):
         load_dotenv()
-        self.exchange = ccxt.binance()
+        # Keep ccxt's rate limiter on so concurrent tasks back off instead of getting banned
+        self.exchange = ccxt_async.binance({'enableRateLimit': True})
         self.min_market_cap = 1000000  # $1M minimum market cap
         self.min_daily_volume = 100000  # $100K minimum daily volume
+        self.max_concurrency = 20  # Concurrent symbol analyses (network-bound)
         self.sentiment_analyzer = SentimentAnalyzer()
         self.technical_analyzer = TechnicalAnalyzer()
-        
-    def get_promising_coins(self):
+        self.ohlcv_cache = OHLCVCache()
+        self.markets_cache_path = 'markets.pkl'
+        self.markets_cache_ttl = 24 * 60 * 60  # Market listings barely change day-to-day
+
+    async def get_promising_coins(self):
         """Identify promising early-stage cryptocurrencies."""
         try:
             # Get all markets from Binance
-            markets = self.exchange.load_markets()
-            promising_coins = []
-            
-            for symbol in markets:
-                if symbol.endswith('/USDT'):
-                    try:
-                        # Get detailed market data
-                        ticker = self.exchange.fetch_ticker(symbol)
-                        
-                        # Basic filtering
-                        if (ticker['quoteVolume'] > self.min_daily_volume):
-                            coin_analysis = self.analyze_coin(symbol, ticker)
-                            if coin_analysis:
-                                promising_coins.append(coin_analysis)
-                    
-                    except Exception as e:
-                        print(f"Error analyzing {symbol}: {str(e)}")
-                        continue
-            
+            await self._load_markets()
+
+            # One snapshot call returns every ticker at once, instead of N round trips
+            tickers = await self.exchange.fetch_tickers()
+            # `or 0` also covers tickers that report quoteVolume as an
+            # explicit None, which .get() with a default would pass through
+            candidates = [(symbol, ticker) for symbol, ticker in tickers.items()
+                          if symbol.endswith('/USDT')
+                          and (ticker.get('quoteVolume') or 0) > self.min_daily_volume]
+
+            # The work is dominated by HTTP round trips, so run the analyses
+            # concurrently, gated by a semaphore to respect rate limits
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def analyze_with_limit(symbol, ticker):
+                async with semaphore:
+                    return await self.analyze_coin(symbol, ticker)
+
+            results = await asyncio.gather(*[analyze_with_limit(symbol, ticker)
+                                             for symbol, ticker in candidates])
+            promising_coins = [coin for coin in results if coin]
+
             # Sort by combined score
             if promising_coins:
                 promising_coins.sort(key=lambda x: x['combined_score'], reverse=True)
-            
+
             return promising_coins
-        
+
         except Exception as e:
             print(f"Error in get_promising_coins: {str(e)}")
             return []
 
-    def analyze_coin(self, symbol, ticker):
+        finally:
+            # The async exchange holds an aiohttp session that must be closed explicitly
+            await self.exchange.close()
+
+    async def _load_markets(self):
+        """Load exchange markets, reusing a day-old local snapshot when possible.
+
+        load_markets is a multi-MB download that runs on every invocation;
+        set_markets with a pickled copy skips it entirely.
+        """
+        try:
+            if (os.path.exists(self.markets_cache_path)
+                    and time.time() - os.path.getmtime(self.markets_cache_path) < self.markets_cache_ttl):
+                with open(self.markets_cache_path, 'rb') as f:
+                    self.exchange.set_markets(pickle.load(f))
+                return
+        except Exception as e:
+            print(f"Error reading markets cache: {str(e)}")
+
+        markets = await self.exchange.load_markets()
+
+        try:
+            with open(self.markets_cache_path, 'wb') as f:
+                pickle.dump(markets, f)
+        except Exception as e:
+            print(f"Error writing markets cache: {str(e)}")
+
+    async def _get_ohlcv(self, symbol, timeframe='1d', limit=30):
+        """Get daily candles, fetching only what the local cache is missing.
+
+        History older than today never changes, so warm runs only refetch
+        from the newest cached candle (which may still be forming) onward.
+        """
+        since = self.exchange.milliseconds() - limit * DAY_MS
+        last_cached_ts = self.ohlcv_cache.last_timestamp(symbol)
+        fetch_since = max(since, last_cached_ts) if last_cached_ts else since
+
+        fresh = await self.exchange.fetch_ohlcv(symbol, timeframe,
+                                                since=fetch_since, limit=limit)
+        if fresh:
+            self.ohlcv_cache.store_candles(symbol, fresh)
+
+        return self.ohlcv_cache.get_candles(symbol, since)
+
+    async def analyze_coin(self, symbol, ticker):
         """Perform comprehensive analysis on a specific coin."""
         try:
-            # Get historical data
-            ohlcv = self.exchange.fetch_ohlcv(symbol, '1d', limit=30)
-            df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('timestamp', inplace=True)
-            
+            # Tickers with a missing or zero open/last price can't be scored,
+            # so bail out before the OHLCV fetch. No score-based pre-filter is
+            # possible here: with the current weighting, best-case potential,
+            # technical, and sentiment alone contribute 7.0 even at maximum
+            # risk, so a conservative ticker-only bound can never drop below
+            # the 6.0 threshold.
+            if not ticker.get('open') or ticker.get('last') is None:
+                return None
+
+            # Get historical data as one typed array — no object-dtype
+            # DataFrame construction or re-inference on the hot path
+            # FP32 is plenty for score thresholds and halves the memory traffic
+            ohlcv = await self._get_ohlcv(symbol, '1d', limit=30)
+            arr = np.asarray(ohlcv, dtype=np.float32)
+            if arr.size == 0:
+                return None
+
+            highs = arr[:, 2]
+            lows = arr[:, 3]
+            closes = arr[:, 4]
+            volumes = arr[:, 5]
+
             # Technical Analysis
-            technical_analysis = self.technical_analyzer.analyze_technical_indicators(df)
+            technical_analysis = self.technical_analyzer.analyze_technical_indicators(
+                closes, highs, lows, volumes)
             
-            # Sentiment Analysis
-            base_symbol = symbol.split('/')[0]
-            sentiment_analysis = self.sentiment_analyzer.analyze_social_sentiment(base_symbol)
+            # Sentiment Analysis (blocking HTTP clients, so run off the event loop)
+            base_symbol = symbol.partition('/')[0]
+            sentiment_analysis = await asyncio.to_thread(
+                self.sentiment_analyzer.analyze_social_sentiment, base_symbol)
             
             # Calculate basic metrics
             price_change_24h = ((ticker['last'] - ticker['open']) / ticker['open']) * 100
-            volume_change_24h = ticker['quoteVolume'] - df['volume'].mean()
-            volatility = df['close'].std() / df['close'].mean() * 100
+            volume_change_24h = ticker['quoteVolume'] - volumes.mean()
+            volatility = closes.std() / closes.mean() * 100
             
             # Risk assessment
             risk_score = self.calculate_risk_score(volatility, volume_change_24h, price_change_24h,
                                                  technical_analysis, sentiment_analysis)
             
             # Potential assessment
-            potential_score = self.assess_potential(df, ticker, technical_analysis, sentiment_analysis)
+            potential_score = self.assess_potential(closes, ticker, technical_analysis, sentiment_analysis)
             
             # Calculate combined score
             combined_score = self.calculate_combined_score(risk_score, potential_score,
@@ -96,8 +169,9 @@ class CryptoAnalyzer:
                     'technical_analysis': technical_analysis,
                     'sentiment_analysis': sentiment_analysis,
                     'analysis_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    'recommendation': self.generate_recommendation(risk_score, potential_score,
-                                                                technical_analysis, sentiment_analysis)
+                    'recommendation': self.generate_recommendation(combined_score, risk_score,
+                                                                potential_score, technical_analysis,
+                                                                sentiment_analysis)
                 }
             
             return None
@@ -106,30 +180,27 @@ class CryptoAnalyzer:
             print(f"Error in analyze_coin for {symbol}: {str(e)}")
             return None
 
+    # Risk point bands, resolved by searchsorted instead of branch chains:
+    # one point per volatility bound exceeded, per drop below a volume
+    # bound, and per price-move bound exceeded
+    VOLATILITY_RISK_BOUNDS = np.array([10.0, 30.0, 50.0])
+    VOLUME_DROP_RISK_BOUNDS = np.array([-50000.0, -20000.0])
+    PRICE_MOVE_RISK_BOUNDS = np.array([15.0, 30.0])
+
     def calculate_risk_score(self, volatility, volume_change, price_change, technical_analysis, sentiment_analysis):
         """Calculate comprehensive risk score (1-10, where 10 is highest risk)."""
         risk_score = 0
-        
+
         # Volatility contribution (0-3 points)
-        if volatility > 50:
-            risk_score += 3
-        elif volatility > 30:
-            risk_score += 2
-        elif volatility > 10:
-            risk_score += 1
-            
+        risk_score += int(np.searchsorted(self.VOLATILITY_RISK_BOUNDS, volatility))
+
         # Volume stability (0-2 points)
-        if volume_change < -50000:
-            risk_score += 2
-        elif volume_change < -20000:
-            risk_score += 1
-            
+        risk_score += len(self.VOLUME_DROP_RISK_BOUNDS) - int(
+            np.searchsorted(self.VOLUME_DROP_RISK_BOUNDS, volume_change, side='right'))
+
         # Price stability (0-2 points)
-        if abs(price_change) > 30:
-            risk_score += 2
-        elif abs(price_change) > 15:
-            risk_score += 1
-            
+        risk_score += int(np.searchsorted(self.PRICE_MOVE_RISK_BOUNDS, abs(price_change)))
+
         # Technical indicators contribution (0-2 points)
         if technical_analysis:
             if technical_analysis['analysis']['volatility']['bb_position'] in ['upper', 'lower']:
@@ -143,7 +214,7 @@ class CryptoAnalyzer:
             
         return risk_score
 
-    def assess_potential(self, df, ticker, technical_analysis, sentiment_analysis):
+    def assess_potential(self, closes, ticker, technical_analysis, sentiment_analysis):
         """Assess potential score (1-10, where 10 is highest potential)."""
         potential_score = 5  # Start with neutral score
         
@@ -167,7 +238,7 @@ class CryptoAnalyzer:
             potential_score += sentiment_boost
             
         # Market performance
-        price_trend = df['close'].pct_change().mean() * 100
+        price_trend = (np.diff(closes) / closes[:-1]).mean() * 100
         if price_trend > 5:
             potential_score += 1
         elif price_trend > 2:
@@ -193,45 +264,48 @@ class CryptoAnalyzer:
             
         return round(combined_score, 2)
 
-    def generate_recommendation(self, risk_score, potential_score, technical_analysis, sentiment_analysis):
+    # Level labels looked up via bisect against their score boundaries
+    RISK_LEVEL_BOUNDS = [3, 6]
+    RISK_LEVEL_LABELS = ['Low', 'Moderate', 'High']
+    POTENTIAL_LEVEL_BOUNDS = [5, 7]
+    POTENTIAL_LEVEL_LABELS = ['Low', 'Moderate', 'High']
+
+    def generate_recommendation(self, combined_score, risk_score, potential_score,
+                                technical_analysis, sentiment_analysis):
         """Generate detailed investment recommendation."""
-        recommendation = []
-        
-        # Overall recommendation
-        combined_score = self.calculate_combined_score(risk_score, potential_score,
-                                                     technical_analysis, sentiment_analysis)
-        
+        # Overall recommendation (combined_score comes precomputed from analyze_coin)
         if combined_score >= 8:
-            recommendation.append("Strong Buy - Exceptional opportunity with high potential and managed risk")
+            overall = "Strong Buy - Exceptional opportunity with high potential and managed risk"
         elif combined_score >= 7:
-            recommendation.append("Buy - Favorable conditions for investment")
+            overall = "Buy - Favorable conditions for investment"
         elif combined_score >= 6:
-            recommendation.append("Consider - Positive indicators with some caution")
+            overall = "Consider - Positive indicators with some caution"
         else:
-            recommendation.append("Hold - Monitor for better entry points")
-            
+            overall = "Hold - Monitor for better entry points"
+
+        parts = [overall]
+
         # Technical Analysis insights
         if technical_analysis:
-            for signal in technical_analysis['signals']:
-                recommendation.append(f"Technical: {signal}")
-                
+            parts.extend("Technical: " + signal for signal in technical_analysis['signals'])
+
         # Risk Assessment
-        risk_level = "Low" if risk_score <= 3 else "Moderate" if risk_score <= 6 else "High"
-        recommendation.append(f"Risk Level: {risk_level} (Score: {risk_score}/10)")
-        
+        risk_level = self.RISK_LEVEL_LABELS[bisect.bisect_left(self.RISK_LEVEL_BOUNDS, risk_score)]
+        parts.append(f"Risk Level: {risk_level} (Score: {risk_score}/10)")
+
         # Potential Assessment
-        potential_level = "High" if potential_score >= 7 else "Moderate" if potential_score >= 5 else "Low"
-        recommendation.append(f"Potential: {potential_level} (Score: {potential_score}/10)")
-        
+        potential_level = self.POTENTIAL_LEVEL_LABELS[bisect.bisect(self.POTENTIAL_LEVEL_BOUNDS, potential_score)]
+        parts.append(f"Potential: {potential_level} (Score: {potential_score}/10)")
+
         # Sentiment insights
         if sentiment_analysis:
-            recommendation.append(f"Market Sentiment: {self.sentiment_analyzer.get_sentiment_summary(sentiment_analysis)}")
-            
-        return "\n".join(recommendation)
+            parts.append("Market Sentiment: " + self.sentiment_analyzer.get_sentiment_summary(sentiment_analysis))
+
+        return "\n".join(parts)
 
 if __name__ == "__main__":
     analyzer = CryptoAnalyzer()
-    promising_coins = analyzer.get_promising_coins()
+    promising_coins = asyncio.run(analyzer.get_promising_coins())
     
     print("\nCrypto Investment Analysis Report")
     print("=" * 50)
@@ -0,0 +1,94 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Without numba the kernels still run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+@njit(cache=True)
+def sma(values, window):
+    """Simple moving average via a running sum (O(n))."""
+    n = values.shape[0]
+    out = np.full(n, np.nan, dtype=values.dtype)
+    if n < window:
+        return out
+
+    running = 0.0
+    for i in range(window):
+        running += values[i]
+    out[window - 1] = running / window
+
+    for i in range(window, n):
+        running += values[i] - values[i - window]
+        out[i] = running / window
+
+    return out
+
+@njit(cache=True)
+def rsi_wilder(values, window):
+    """RSI with Wilder smoothing: avg = (prev * (n - 1) + curr) / n."""
+    n = values.shape[0]
+    out = np.full(n, np.nan, dtype=values.dtype)
+    if n <= window:
+        return out
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, window + 1):
+        delta = values[i] - values[i - 1]
+        if delta > 0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= window
+    avg_loss /= window
+
+    if avg_loss == 0.0:
+        out[window] = 100.0
+    else:
+        out[window] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    for i in range(window + 1, n):
+        delta = values[i] - values[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        avg_gain = (avg_gain * (window - 1) + gain) / window
+        avg_loss = (avg_loss * (window - 1) + loss) / window
+        if avg_loss == 0.0:
+            out[i] = 100.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    return out
+
+@njit(cache=True)
+def bollinger_bands(values, window, num_std):
+    """Bollinger Bands; returns (upper, middle, lower) arrays."""
+    n = values.shape[0]
+    upper = np.full(n, np.nan, dtype=values.dtype)
+    mid = np.full(n, np.nan, dtype=values.dtype)
+    lower = np.full(n, np.nan, dtype=values.dtype)
+
+    for i in range(window - 1, n):
+        total = 0.0
+        total_sq = 0.0
+        for j in range(i - window + 1, i + 1):
+            total += values[j]
+            total_sq += values[j] * values[j]
+        mean = total / window
+        variance = total_sq / window - mean * mean
+        if variance < 0.0:
+            variance = 0.0
+        std = variance ** 0.5
+        mid[i] = mean
+        upper[i] = mean + num_std * std
+        lower[i] = mean - num_std * std
+
+    return upper, mid, lower
@@ -0,0 +1,45 @@
+import sqlite3
+
+class OHLCVCache:
+    def __init__(self, db_path='ohlcv_cache.db'):
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS ohlcv (
+                symbol TEXT NOT NULL,
+                ts INTEGER NOT NULL,
+                open REAL,
+                high REAL,
+                low REAL,
+                close REAL,
+                volume REAL,
+                PRIMARY KEY (symbol, ts)
+            )"""
+        )
+        self.conn.commit()
+
+    def last_timestamp(self, symbol):
+        """Return the timestamp of the newest cached candle, or None if empty."""
+        row = self.conn.execute(
+            "SELECT MAX(ts) FROM ohlcv WHERE symbol = ?", (symbol,)
+        ).fetchone()
+        return row[0]
+
+    def get_candles(self, symbol, since_ts):
+        """Return cached candles from since_ts onward as [ts, o, h, l, c, v] rows."""
+        rows = self.conn.execute(
+            "SELECT ts, open, high, low, close, volume FROM ohlcv "
+            "WHERE symbol = ? AND ts >= ? ORDER BY ts",
+            (symbol, since_ts)
+        ).fetchall()
+        return [list(row) for row in rows]
+
+    def store_candles(self, symbol, candles):
+        """Upsert freshly fetched candles (today's still-forming candle included)."""
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO ohlcv VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(symbol, c[0], c[1], c[2], c[3], c[4], c[5]) for c in candles]
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
@@ -1,10 +1,14 @@
 import tweepy
 import praw
 import os
-from textblob import TextBlob
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 from collections import defaultdict
+from cachetools import TTLCache
 
 class SentimentAnalyzer:
     def __init__(self):
@@ -12,6 +16,15 @@ class SentimentAnalyzer:
         self.twitter_api = self._setup_twitter()
         # Reddit setup
         self.reddit_api = self._setup_reddit()
+        # VADER scores each text with plain dict lookups — far cheaper than
+        # TextBlob's per-call tokenization, and tuned for social media slang
+        self._vader = SentimentIntensityAnalyzer()
+        # Optional crypto-tuned transformer; scores whole batches at once
+        self.sentiment_model = self._setup_sentiment_model()
+        # Sentiment barely moves minute-to-minute and API quotas are tight,
+        # so cache results for an hour per symbol
+        self._sentiment_cache = TTLCache(maxsize=512, ttl=3600)
+        self._cache_lock = threading.Lock()
         
     def _setup_twitter(self):
         try:
@@ -39,12 +52,57 @@ class SentimentAnalyzer:
             print(f"Reddit API setup failed: {str(e)}")
             return None
 
+    def _setup_sentiment_model(self):
+        try:
+            from transformers import pipeline
+            import torch
+            device = 0 if torch.cuda.is_available() else -1
+            return pipeline('sentiment-analysis', model='ElKulako/cryptobert',
+                            device=device)
+        except Exception:
+            # transformers/torch are optional; VADER stays the fallback scorer
+            return None
+
+    def _score_texts(self, texts):
+        """Score a batch of texts, returning one polarity in [-1, 1] per text."""
+        scores = [0.0] * len(texts)
+        nonempty = [(i, text) for i, text in enumerate(texts) if text]
+        if not nonempty:
+            return scores
+
+        if self.sentiment_model is not None:
+            results = self.sentiment_model([text for _, text in nonempty],
+                                           batch_size=64, truncation=True)
+            for (i, _), result in zip(nonempty, results):
+                label = result['label'].lower()
+                if 'bull' in label or 'pos' in label:
+                    scores[i] = result['score']
+                elif 'bear' in label or 'neg' in label:
+                    scores[i] = -result['score']
+        else:
+            for i, text in nonempty:
+                scores[i] = self._vader.polarity_scores(text)['compound']
+
+        return scores
+
     def analyze_social_sentiment(self, symbol, timeframe_hours=24):
         """Analyze social media sentiment for a given crypto symbol."""
-        sentiment_data = {
-            'twitter': self._analyze_twitter_sentiment(symbol, timeframe_hours),
-            'reddit': self._analyze_reddit_sentiment(symbol, timeframe_hours)
-        }
+        cache_key = (symbol, timeframe_hours)
+        with self._cache_lock:
+            cached = self._sentiment_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Twitter and Reddit lookups are independent HTTP calls, so overlap them
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            twitter_future = executor.submit(self._analyze_twitter_sentiment,
+                                             symbol, timeframe_hours)
+            reddit_future = executor.submit(self._analyze_reddit_sentiment,
+                                            symbol, timeframe_hours)
+            sentiment_data = {
+                'twitter': twitter_future.result(),
+                'reddit': reddit_future.result()
+            }
         
         # Combine sentiment scores
         total_sentiment = 0
@@ -58,13 +116,18 @@ class SentimentAnalyzer:
         
         if total_weight == 0:
             return None
-            
-        return {
+
+        result = {
             'combined_score': total_sentiment / total_weight,
             'details': sentiment_data,
             'analysis_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
 
+        with self._cache_lock:
+            self._sentiment_cache[cache_key] = result
+
+        return result
+
     def _analyze_twitter_sentiment(self, symbol, timeframe_hours):
         if not self.twitter_api:
             return {'score': None, 'message': 'Twitter API not available'}
@@ -79,11 +142,8 @@ class SentimentAnalyzer:
                 tweet_mode="extended"
             )
             
-            sentiments = []
-            for tweet in tweets:
-                analysis = TextBlob(tweet.full_text)
-                sentiments.append(analysis.sentiment.polarity)
-            
+            sentiments = self._score_texts([tweet.full_text for tweet in tweets])
+
             if not sentiments:
                 return {'score': None, 'message': 'No tweets found'}
                 
@@ -102,36 +162,31 @@ class SentimentAnalyzer:
             return {'score': None, 'message': 'Reddit API not available'}
             
         try:
-            # Search in relevant subreddits
+            # Search in relevant subreddits, one worker per subreddit
             subreddits = ['cryptocurrency', 'cryptomarkets', f'{symbol.lower()}']
             posts = []
-            
-            for subreddit in subreddits:
+
+            def search_subreddit(subreddit):
                 try:
                     sub = self.reddit_api.subreddit(subreddit)
-                    posts.extend(sub.search(
+                    return list(sub.search(
                         query=symbol,
                         time_filter='day',
                         limit=50
                     ))
                 except:
-                    continue
+                    return []
+
+            with ThreadPoolExecutor(max_workers=len(subreddits)) as executor:
+                for result in executor.map(search_subreddit, subreddits):
+                    posts.extend(result)
             
-            sentiments = []
-            for post in posts:
-                # Analyze post title and body
-                title_analysis = TextBlob(post.title)
-                body_analysis = TextBlob(post.selftext) if post.selftext else None
-                
-                # Weight title sentiment more heavily than body
-                title_weight = 0.6
-                body_weight = 0.4
-                
-                sentiment = title_analysis.sentiment.polarity * title_weight
-                if body_analysis:
-                    sentiment += body_analysis.sentiment.polarity * body_weight
-                
-                sentiments.append(sentiment)
+            # Score all titles and bodies in two batches, weighting titles
+            # more heavily; posts without a body contribute title only
+            title_scores = self._score_texts([post.title for post in posts])
+            body_scores = self._score_texts([post.selftext for post in posts])
+            sentiments = [title * 0.6 + body * 0.4
+                          for title, body in zip(title_scores, body_scores)]
             
             if not sentiments:
                 return {'score': None, 'message': 'No Reddit posts found'}
@@ -146,20 +201,20 @@ class SentimentAnalyzer:
         except Exception as e:
             return {'score': None, 'message': f'Error: {str(e)}'}
 
+    # Summary labels indexed by searchsorted over the score boundaries
+    SUMMARY_THRESHOLDS = np.array([-0.5, -0.2, 0.2, 0.5])
+    SUMMARY_LABELS = [
+        "Very Negative - Strong community skepticism or criticism",
+        "Negative - Significant community concerns",
+        "Neutral - Mixed or balanced community sentiment",
+        "Positive - Generally favorable community sentiment",
+        "Very Positive - Strong community enthusiasm and support"
+    ]
+
     def get_sentiment_summary(self, sentiment_data):
         """Generate a human-readable summary of sentiment analysis."""
         if not sentiment_data or 'combined_score' not in sentiment_data:
             return "Sentiment analysis unavailable"
-            
+
         score = sentiment_data['combined_score']
-        
-        if score >= 0.5:
-            return "Very Positive - Strong community enthusiasm and support"
-        elif score >= 0.2:
-            return "Positive - Generally favorable community sentiment"
-        elif score >= -0.2:
-            return "Neutral - Mixed or balanced community sentiment"
-        elif score >= -0.5:
-            return "Negative - Significant community concerns"
-        else:
-            return "Very Negative - Strong community skepticism or criticism"
+        return self.SUMMARY_LABELS[np.searchsorted(self.SUMMARY_THRESHOLDS, score, side='right')]
@@ -1,32 +1,45 @@
 import pandas as pd
 import numpy as np
-from ta import add_all_ta_features
-from ta.utils import dropna
-from ta.volatility import BollingerBands
-from ta.trend import MACD, EMAIndicator
-from ta.momentum import RSIIndicator
-from datetime import datetime, timedelta
+from ta.trend import MACD
+from datetime import datetime
+import indicator_kernels
+
+try:
+    # Optional accelerator: talib runs hand-tuned C loops over raw arrays,
+    # roughly 5-8x faster than the pandas/ta equivalents
+    import talib
+except ImportError:
+    talib = None
 
 class TechnicalAnalyzer:
     def __init__(self):
         self.indicators = {}
-        
-    def analyze_technical_indicators(self, df):
-        """Perform comprehensive technical analysis on price data."""
+
+    def analyze_technical_indicators(self, closes, highs, lows, volumes):
+        """Perform comprehensive technical analysis on raw OHLCV arrays."""
         try:
-            # Ensure we have OHLCV data
-            required_columns = ['open', 'high', 'low', 'close', 'volume']
-            if not all(col in df.columns for col in required_columns):
-                return None
-                
-            # Clean data
-            df = dropna(df)
-            
+            # FP32 throughout: indicator thresholds (RSI 30/70, BB bands) sit
+            # far outside float32 epsilon, and the narrower lanes double
+            # effective SIMD width and cache footprint
+            closes = np.asarray(closes, dtype=np.float32)
+            highs = np.asarray(highs, dtype=np.float32)
+            lows = np.asarray(lows, dtype=np.float32)
+            volumes = np.asarray(volumes, dtype=np.float32)
+
+            # Clean data: keep only candles where every series is finite
+            mask = (np.isfinite(closes) & np.isfinite(highs)
+                    & np.isfinite(lows) & np.isfinite(volumes))
+            if not mask.all():
+                closes = closes[mask]
+                highs = highs[mask]
+                lows = lows[mask]
+                volumes = volumes[mask]
+
             # Calculate all technical indicators
-            df = self._calculate_indicators(df)
-            
+            indicators = self._calculate_indicators(closes, highs, lows, volumes)
+
             # Generate analysis
-            analysis = self._analyze_indicators(df)
+            analysis = self._analyze_indicators(indicators)
             
             return {
                 'technical_score': self._calculate_technical_score(analysis),
@@ -39,112 +52,144 @@ class TechnicalAnalyzer:
             print(f"Error in technical analysis: {str(e)}")
             return None
 
-    def _calculate_indicators(self, df):
-        """Calculate various technical indicators."""
+    def _calculate_indicators(self, closes, highs, lows, volumes):
+        """Calculate various technical indicators as a dict of numpy arrays."""
+        indicators = {'close': closes, 'volume': volumes}
         try:
-            # Trend Indicators
-            macd = MACD(close=df['close'])
-            df['macd'] = macd.macd()
-            df['macd_signal'] = macd.macd_signal()
-            
-            # Momentum Indicators
-            rsi = RSIIndicator(close=df['close'])
-            df['rsi'] = rsi.rsi()
-            
-            # Volatility Indicators
-            bb = BollingerBands(close=df['close'])
-            df['bb_high'] = bb.bollinger_hband()
-            df['bb_low'] = bb.bollinger_lband()
-            df['bb_mid'] = bb.bollinger_mavg()
-            
-            # Volume Indicators
-            df['volume_sma'] = df['volume'].rolling(window=20).mean()
-            
-            # Price Action
-            df['sma_20'] = df['close'].rolling(window=20).mean()
-            df['sma_50'] = df['close'].rolling(window=50).mean()
-            df['sma_200'] = df['close'].rolling(window=200).mean()
-            
+            if talib is not None:
+                # talib insists on float64 input, so convert at its boundary
+                closes64 = closes.astype(np.float64)
+                volumes64 = volumes.astype(np.float64)
+
+                # Trend Indicators
+                macd, macd_signal, _ = talib.MACD(closes64)
+                indicators['macd'] = macd.astype(np.float32)
+                indicators['macd_signal'] = macd_signal.astype(np.float32)
+
+                # Momentum Indicators
+                indicators['rsi'] = talib.RSI(closes64, timeperiod=14).astype(np.float32)
+
+                # Volatility Indicators
+                bb_high, bb_mid, bb_low = talib.BBANDS(closes64, timeperiod=20)
+                indicators['bb_high'] = bb_high.astype(np.float32)
+                indicators['bb_low'] = bb_low.astype(np.float32)
+                indicators['bb_mid'] = bb_mid.astype(np.float32)
+
+                # Volume Indicators
+                indicators['volume_sma'] = talib.SMA(volumes64, timeperiod=20).astype(np.float32)
+
+                # Price Action
+                indicators['sma_20'] = talib.SMA(closes64, timeperiod=20).astype(np.float32)
+                indicators['sma_50'] = talib.SMA(closes64, timeperiod=50).astype(np.float32)
+                indicators['sma_200'] = talib.SMA(closes64, timeperiod=200).astype(np.float32)
+            else:
+                # Fall back to numba-jitted kernels over the same raw arrays
+
+                # Trend Indicators (ta's MACD wants a Series, so wrap just here)
+                macd = MACD(close=pd.Series(closes))
+                indicators['macd'] = macd.macd().to_numpy()
+                indicators['macd_signal'] = macd.macd_signal().to_numpy()
+
+                # Momentum Indicators (Wilder smoothing, same as ta's RSIIndicator)
+                indicators['rsi'] = indicator_kernels.rsi_wilder(closes, 14)
+
+                # Volatility Indicators
+                bb_high, bb_mid, bb_low = indicator_kernels.bollinger_bands(closes, 20, 2.0)
+                indicators['bb_high'] = bb_high
+                indicators['bb_low'] = bb_low
+                indicators['bb_mid'] = bb_mid
+
+                # Volume Indicators
+                indicators['volume_sma'] = indicator_kernels.sma(volumes, 20)
+
+                # Price Action
+                indicators['sma_20'] = indicator_kernels.sma(closes, 20)
+                indicators['sma_50'] = indicator_kernels.sma(closes, 50)
+                indicators['sma_200'] = indicator_kernels.sma(closes, 200)
+
             # Price changes
-            df['price_change_24h'] = df['close'].pct_change(periods=1)
-            df['price_change_7d'] = df['close'].pct_change(periods=7)
-            
-            return df
-            
+            indicators['price_change_24h'] = self._pct_change(closes, 1)
+            indicators['price_change_7d'] = self._pct_change(closes, 7)
+
+            return indicators
+
         except Exception as e:
             print(f"Error calculating indicators: {str(e)}")
-            return df
+            return indicators
 
-    def _analyze_indicators(self, df):
+    @staticmethod
+    def _pct_change(values, periods):
+        """Fractional change over `periods` steps, NaN-padded at the front."""
+        out = np.full(values.shape[0], np.nan, dtype=values.dtype)
+        if values.shape[0] > periods:
+            out[periods:] = values[periods:] / values[:-periods] - 1
+        return out
+
+    # Columns whose final-row values feed the analysis helpers
+    LATEST_COLUMNS = ['macd', 'macd_signal', 'sma_20', 'sma_50', 'sma_200',
+                      'close', 'rsi', 'bb_high', 'bb_low', 'bb_mid',
+                      'volume', 'volume_sma', 'price_change_24h', 'price_change_7d']
+
+    def _analyze_indicators(self, indicators):
         """Analyze the calculated indicators."""
-        latest = df.iloc[-1]
-        prev = df.iloc[-2]
-        
+        # Pull the final-row scalars once and hand them to every helper
+        latest = {col: indicators[col][-1] for col in self.LATEST_COLUMNS}
+
         analysis = {
-            'trend': self._analyze_trend(df),
-            'momentum': self._analyze_momentum(df),
-            'volatility': self._analyze_volatility(df),
-            'volume': self._analyze_volume(df),
-            'price_action': self._analyze_price_action(df)
+            'trend': self._analyze_trend(latest),
+            'momentum': self._analyze_momentum(latest),
+            'volatility': self._analyze_volatility(latest),
+            'volume': self._analyze_volume(latest),
+            'price_action': self._analyze_price_action(latest)
         }
-        
+
         return analysis
 
-    def _analyze_trend(self, df):
+    def _analyze_trend(self, latest):
         """Analyze trend indicators."""
-        latest = df.iloc[-1]
-        
         trend_analysis = {
             'macd_trend': 'bullish' if latest['macd'] > latest['macd_signal'] else 'bearish',
             'sma_trend': 'bullish' if latest['sma_20'] > latest['sma_50'] else 'bearish',
             'long_term_trend': 'bullish' if latest['close'] > latest['sma_200'] else 'bearish'
         }
-        
+
         return trend_analysis
 
-    def _analyze_momentum(self, df):
+    def _analyze_momentum(self, latest):
         """Analyze momentum indicators."""
-        latest = df.iloc[-1]
-        
         momentum_analysis = {
             'rsi_value': latest['rsi'],
             'rsi_condition': 'overbought' if latest['rsi'] > 70 else 'oversold' if latest['rsi'] < 30 else 'neutral'
         }
-        
+
         return momentum_analysis
 
-    def _analyze_volatility(self, df):
+    def _analyze_volatility(self, latest):
         """Analyze volatility indicators."""
-        latest = df.iloc[-1]
-        
         volatility_analysis = {
             'bb_position': 'upper' if latest['close'] > latest['bb_high'] else 'lower' if latest['close'] < latest['bb_low'] else 'middle',
             'bb_width': (latest['bb_high'] - latest['bb_low']) / latest['bb_mid']
         }
-        
+
         return volatility_analysis
 
-    def _analyze_volume(self, df):
+    def _analyze_volume(self, latest):
         """Analyze volume indicators."""
-        latest = df.iloc[-1]
-        
         volume_analysis = {
             'volume_trend': 'increasing' if latest['volume'] > latest['volume_sma'] else 'decreasing',
             'volume_change': (latest['volume'] - latest['volume_sma']) / latest['volume_sma']
         }
-        
+
         return volume_analysis
 
-    def _analyze_price_action(self, df):
+    def _analyze_price_action(self, latest):
         """Analyze price action."""
-        latest = df.iloc[-1]
-        
         price_analysis = {
             'price_change_24h': latest['price_change_24h'],
             'price_change_7d': latest['price_change_7d'],
             'above_200_sma': latest['close'] > latest['sma_200']
         }
-        
+
         return price_analysis
 
     def _calculate_technical_score(self, analysis):